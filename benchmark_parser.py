@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark and generated-corpus check for ContentParser.
+
+Generates realistic agent outputs (multiple platforms, emoji and bold
+header variants, long slide decks, JSON blocks, stray reasoning text and
+adversarial near-headers), then measures parse throughput (MB/s),
+per-call and per-item latency, and peak allocations across input sizes.
+
+Usage:
+    python benchmark_parser.py                      # compare against baseline
+    python benchmark_parser.py --update-baseline    # record a new baseline
+
+Property violations already recorded in the baseline are tolerated; new
+ones fail (or any, with --strict-properties). Peak allocations are gated
+strictly against the baseline; throughput and latency are report-only
+unless --timing-tolerance is given.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, 'backend')
+
+BASELINE_PATH = "parser_benchmark_baseline.json"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+PLATFORMS = ["linkedin", "twitter", "pitch_deck"]
+
+# CONTENT_PARSING_IMPLEMENTATION_SUMMARY.md: "< 100ms for 10,000 characters"
+DOCUMENTED_LATENCY_MS = {10_000: 100.0}
+
+HEADER_VARIANTS = {
+    "linkedin": ["### 💼 LinkedIn", "### LinkedIn", "## LinkedIn Post", "### **LinkedIn Content**:",
+                 "### 📈 LinkedIn"],
+    "twitter": ["### 🐦 Twitter", "### Twitter", "## Twitter Post", "### **Twitter**",
+                "### 📱 Twitter Content:"],
+    "pitch_deck": ["### 📊 Pitch Deck", "### Pitch Deck", "## PitchDeck", "### **Pitch Deck Content**",
+                   "### 📊 Pitch  Deck:"],
+}
+
+REASONING_LINES = [
+    "Let me create better LinkedIn content that's within the optimal range:",
+    "Let me validate this LinkedIn content quality:",
+    "Now let me generate Twitter...",
+    "I'll start with the research insights from the knowledge base.",
+]
+
+NEAR_HEADERS = [
+    "### LinkedIn-style tips for founders",
+    "#### Twitterverse trends",
+    "### 🐦",
+    "Follow us on ### Twitter for updates",
+    "**LinkedIn:** see the post above",
+    "### Pitch Decks that work (a reading list)",
+]
+
+WORDS = (
+    "AI productivity workflow teams automation insight growth launch customers "
+    "platform data security integration scale roadmap feedback results pilot "
+    "efficiency onboarding analytics collaboration innovation strategy"
+).split()
+
+EMOJI = ["🚀", "✨", "📈", "💡", "🔥", "✅", "🎯", "🤝"]
+
+HASHTAGS = ["#AI", "#Productivity", "#Innovation", "#Tech", "#Startups", "#SaaS", "#Growth",
+            "#FutureOfWork", "#B2B", "#Automation"]
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(WORDS, k=rng.randint(6, 18))
+    words[0] = words[0].capitalize()
+    sentence = " ".join(words) + rng.choice([".", "!", "."])
+    if rng.random() < 0.3:
+        sentence += f" {rng.choice(EMOJI)}"
+    return sentence
+
+
+def _hashtag_line(rng: random.Random) -> str:
+    label = rng.choice(["**Hashtags:** ", "Hashtags: ", ""])
+    return label + " ".join(rng.sample(HASHTAGS, rng.randint(2, 6)))
+
+
+# Sections are built from blocks: self-contained runs of lines that end
+# with a blank line. The first block of a section is its required content;
+# the rest are optional and can be dropped whole when trimming to size, so
+# a trimmed output never loses a platform's content or cuts a fence open.
+
+def _linkedin_section(rng: random.Random) -> List[Dict]:
+    label = rng.choice(["**Professional Post:**", "**Content:**", ""])
+    opening = " ".join(_sentence(rng) for _ in range(rng.randint(1, 2)))
+    blocks = [{"lines": ([label] if label else []) + [opening, ""]}]
+    for _ in range(rng.randint(1, 4)):
+        blocks.append({"lines": [" ".join(_sentence(rng) for _ in range(rng.randint(1, 4))), ""]})
+    if rng.random() < 0.5:
+        bullets = [f"- {_sentence(rng)}" for _ in range(rng.randint(2, 5))]
+        blocks.append({"lines": ["Key benefits:"] + bullets + [""]})
+    blocks.append({"lines": [_hashtag_line(rng), ""]})
+    return blocks
+
+
+def _twitter_section(rng: random.Random) -> List[Dict]:
+    tweet = _sentence(rng)[:200] + " " + " ".join(rng.sample(HASHTAGS, 2))
+    blocks = [{"lines": [f"**Content:** {tweet}", ""]}]
+    if rng.random() < 0.3:
+        thread = [f"{i}/ {_sentence(rng)[:240]}" for i in range(1, rng.randint(3, 6))]
+        blocks.append({"lines": thread + [""]})
+    blocks.append({"lines": [_hashtag_line(rng), ""]})
+    return blocks
+
+
+def _pitch_deck_section(rng: random.Random, slides: int) -> List[Dict]:
+    blocks = []
+    for number in range(1, slides + 1):
+        title = rng.choice(["Problem", "Solution", "Market", "Traction", "Team", "Ask", "Roadmap"])
+        heading = rng.choice([f"**Slide {number}: {title}**", f"Slide {number} - {title}",
+                              f"#### Slide {number}: {title}"])
+        # Slide 1 is the required block; keep it short enough for small buckets
+        bullets = [f"- {_sentence(rng)}" for _ in range(rng.randint(1, 2 if number == 1 else 4))]
+        blocks.append({"lines": [heading, ""] + bullets + [""], "slide": number})
+    return blocks
+
+
+def _json_block(rng: random.Random, platform: str) -> Dict:
+    payload = {
+        "platform": platform,
+        "content": " ".join(_sentence(rng) for _ in range(rng.randint(1, 3))),
+        "hashtags": rng.sample(HASHTAGS, 3),
+    }
+    return {"lines": ["```json", json.dumps(payload, ensure_ascii=False, indent=2), "```", ""]}
+
+
+def _length(lines: List[str]) -> int:
+    return sum(len(line) + 1 for line in lines)
+
+
+SEPARATOR = ["---", ""]
+TRIM_WINDOW_SECTIONS = 6
+
+
+def _section_blocks(rng: random.Random, platform: str, target_chars: int) -> List[Dict]:
+    if platform == "pitch_deck":
+        return _pitch_deck_section(rng, rng.randint(3, max(3, min(12, target_chars // 300))))
+    if platform == "twitter":
+        return _twitter_section(rng)
+    return _linkedin_section(rng)
+
+
+def _section_length(section: Dict) -> int:
+    return _length([section["header"], ""] + [line for b in section["blocks"] for line in b["lines"]]
+                   + SEPARATOR)
+
+
+def _trim_to_target(sections: List[Dict], required_sections: int, total: int,
+                    target_chars: int) -> None:
+    """Drop whole sections and optional blocks so `total` lands just under the target.
+
+    Surplus sections go first while the output stays at or over the
+    target. The remaining overshoot is covered by the smallest-total set of
+    optional blocks from the last few sections (a deck may only lose its
+    trailing slides, so numbering stays contiguous).
+    """
+    while len(sections) > required_sections and \
+            total - _section_length(sections[-1]) >= target_chars:
+        total -= _section_length(sections.pop())
+    overshoot = total - target_chars
+    if overshoot <= 0:
+        return
+
+    # Each group offers alternative drops: (chars saved, [(section, block), ...])
+    groups: List[List[Tuple[int, List[Tuple[int, int]]]]] = []
+    for index in range(max(0, len(sections) - TRIM_WINDOW_SECTIONS), len(sections)):
+        blocks = sections[index]["blocks"]
+        slides = [p for p in range(1, len(blocks)) if "slide" in blocks[p]]
+        for position in range(1, len(blocks)):
+            if position not in slides:
+                groups.append([(_length(blocks[position]["lines"]), [(index, position)])])
+        options, saved = [], 0
+        for count, position in enumerate(reversed(slides), start=1):
+            saved += _length(blocks[position]["lines"])
+            options.append((saved, [(index, p) for p in slides[-count:]]))
+        if options:
+            groups.append(options)
+
+    # Reachable savings below the overshoot, plus the best way past it
+    reachable: Dict[int, List[Tuple[int, int]]] = {0: []}
+    best: Optional[Tuple[int, List[Tuple[int, int]]]] = None
+    for options in groups:
+        for reached, picks in list(reachable.items()):
+            for saved, drop in options:
+                combined = reached + saved
+                if combined >= overshoot:
+                    if best is None or combined < best[0]:
+                        best = (combined, picks + drop)
+                elif combined not in reachable:
+                    reachable[combined] = picks + drop
+    if best is None:
+        best = (0, reachable[max(reachable)])
+
+    for index, position in sorted(best[1], reverse=True):
+        del sections[index]["blocks"][position]
+
+
+def generate_agent_output(rng: random.Random, target_chars: int) -> Dict:
+    """Generate one synthetic agent response of at most about `target_chars`.
+
+    Every requested platform gets at least one section. Sections are added
+    until the target is reached, then whole optional blocks (extra
+    paragraphs, bullet lists, threads, trailing slides, JSON blocks) or
+    surplus sections are dropped to land at or just under the target. The
+    returned sample lists the near-headers that survived so the parse
+    result can be checked for them.
+    """
+    requested = rng.sample(PLATFORMS, rng.randint(1, len(PLATFORMS)))
+    preamble: List[str] = []
+    if rng.random() < 0.3:
+        preamble = [rng.choice(REASONING_LINES), ""]
+
+    sections: List[Dict] = []
+    total = _length(preamble)
+    while total < target_chars or len(sections) < len(requested):
+        platform = requested[len(sections) % len(requested)]
+        blocks = _section_blocks(rng, platform, target_chars)
+        if rng.random() < 0.15:
+            blocks.append(_json_block(rng, platform))
+        if rng.random() < 0.1:
+            blocks.append({"lines": [rng.choice(REASONING_LINES), ""]})
+        if rng.random() < 0.2:
+            # Never ahead of the required block, so it can't be the item start
+            blocks.insert(rng.randint(1, len(blocks)), {"lines": [rng.choice(NEAR_HEADERS), ""]})
+        section = {"header": rng.choice(HEADER_VARIANTS[platform]), "blocks": blocks}
+        sections.append(section)
+        total += _section_length(section)
+
+    _trim_to_target(sections, len(requested), total, target_chars)
+
+    lines = list(preamble)
+    for section in sections:
+        lines.extend([section["header"], ""])
+        for block in section["blocks"]:
+            lines.extend(block["lines"])
+        lines.extend(SEPARATOR)
+
+    return {
+        "text": "\n".join(lines),
+        "requested_platforms": requested,
+        "near_headers": [b["lines"][0] for section in sections for b in section["blocks"]
+                         if b["lines"][0] in NEAR_HEADERS],
+    }
+
+
+def generate_corpus(seed: int, sizes: List[int], samples: int) -> Dict[int, List[Dict]]:
+    rng = random.Random(seed)
+    return {size: [generate_agent_output(rng, size) for _ in range(samples)] for size in sizes}
+
+
+def _normalize(text: str) -> str:
+    """Ignore bold markers and whitespace when matching lines in parsed content"""
+    return " ".join(text.replace("*", "").split())
+
+
+NORMALIZED_NEAR_HEADERS = {_normalize(line) for line in NEAR_HEADERS}
+
+
+def check_properties(result: Dict, sample: Dict) -> List[str]:
+    """Structural invariants every parse result must satisfy"""
+    problems = []
+    items = result.get("content_items")
+    if not isinstance(items, list):
+        return ["content_items is not a list"]
+    score = result.get("completeness_score", 0.0)
+    if not 0.0 <= score <= 1.0:
+        problems.append(f"completeness_score out of range: {score}")
+
+    found = set()
+    contents = []
+    for item in items:
+        platform = item.get("platform")
+        if platform not in PLATFORMS:
+            problems.append(f"unexpected platform: {platform}")
+        found.add(platform)
+        content = item.get("content", "")
+        contents.append(_normalize(content))
+        first_line = _normalize(content.strip().split("\n", 1)[0])
+        if first_line in NORMALIZED_NEAR_HEADERS:
+            problems.append(f"near-header started a {platform} item: {first_line!r}")
+
+    for platform in sample["requested_platforms"]:
+        if platform not in found:
+            problems.append(f"no item for requested platform: {platform}")
+    for platform in result.get("missing_platforms") or []:
+        problems.append(f"missing_platforms reported: {platform}")
+
+    # A near-header treated as a section boundary ends the item early, so
+    # the line itself never makes it into any item's content
+    all_content = "\n".join(contents)
+    for line in sample["near_headers"]:
+        if _normalize(line) not in all_content:
+            problems.append(f"near-header split or dropped an item: {line!r}")
+    return problems
+
+
+def count_reasoning_items(result: Dict) -> int:
+    """Items still carrying stray reasoning lines.
+
+    Reasoning is filtered upstream by extract_agent_output (see
+    REASONING_TEXT_FIX_SUMMARY.md), not by the parser, so this is
+    reported but never gated.
+    """
+    return sum(1 for item in result.get("content_items") or []
+               if any(line in item.get("content", "") for line in REASONING_LINES))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = max(1, int(-(-pct * len(ordered) // 100)))
+    return ordered[rank - 1]
+
+
+def _parse(parser, sample: Dict) -> Dict:
+    return parser.parse_agent_output(
+        agent_response=sample["text"],
+        platform=sample["requested_platforms"][0],
+        requested_platforms=sample["requested_platforms"]
+    )
+
+
+def benchmark_size(parser, samples: List[Dict], repeats: int) -> Dict:
+    """Time and profile every sample of one size bucket"""
+    call_ms: List[float] = []
+    item_ms: List[float] = []
+    total_bytes = 0
+    total_seconds = 0.0
+    violations: List[str] = []
+    reasoning_items = 0
+
+    for sample in samples:
+        size_bytes = len(sample["text"].encode("utf-8"))
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = _parse(parser, sample)
+            elapsed = time.perf_counter() - start
+            total_seconds += elapsed
+            total_bytes += size_bytes
+            call_ms.append(elapsed * 1000)
+            item_ms.append(elapsed * 1000 / max(1, len(result.get("content_items", []))))
+        violations.extend(check_properties(result, sample))
+        reasoning_items += count_reasoning_items(result)
+
+    # Allocation profiling runs separately; tracemalloc distorts timings
+    peaks = []
+    for sample in samples:
+        tracemalloc.start()
+        _parse(parser, sample)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {
+        "samples": len(samples),
+        "mean_chars": round(sum(len(s["text"]) for s in samples) / len(samples)),
+        "mean_bytes": round(sum(len(s["text"].encode("utf-8")) for s in samples) / len(samples)),
+        "throughput_mb_s": round(total_bytes / total_seconds / 1_000_000, 3) if total_seconds else 0.0,
+        "call_p50_ms": round(_percentile(call_ms, 50), 3),
+        "call_p95_ms": round(_percentile(call_ms, 95), 3),
+        "item_p95_ms": round(_percentile(item_ms, 95), 3),
+        "peak_alloc_kb_p95": round(_percentile(peaks, 95) / 1024, 1),
+        "property_violations": sorted(set(violations)),
+        "reasoning_items": reasoning_items,
+    }
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                        alloc_tolerance: float,
+                        timing_tolerance: Optional[float]) -> Tuple[List[str], List[str]]:
+    """Compare against the stored baseline.
+
+    Property violations fail only when they are not already recorded in
+    the baseline. Peak allocations are deterministic for a given corpus
+    and interpreter, so they are gated with `alloc_tolerance`. Wall-clock metrics vary on
+    shared runners and are only gated when `timing_tolerance` is set;
+    otherwise they are returned as warnings. Returns (failures, warnings).
+    """
+    failures: List[str] = []
+    warnings: List[str] = []
+    for size, current in results.items():
+        previous = baseline.get(size)
+        if not previous:
+            failures.append(f"{size} chars: no baseline entry; re-record with --update-baseline")
+            continue
+        if current["mean_bytes"] != previous.get("mean_bytes"):
+            failures.append(
+                f"{size} chars: corpus is {current['mean_bytes']} bytes on average, baseline was "
+                f"{previous.get('mean_bytes')}; re-record with --update-baseline"
+            )
+            continue
+
+        known = set(previous.get("property_violations", []))
+        failures.extend(f"{size} chars: new property violation: {v}"
+                        for v in current["property_violations"] if v not in known)
+        warnings.extend(f"{size} chars: no longer seen, re-record to lock in: {v}"
+                        for v in sorted(known - set(current["property_violations"])))
+
+        if current["peak_alloc_kb_p95"] > previous["peak_alloc_kb_p95"] * (1 + alloc_tolerance):
+            failures.append(f"{size} chars: peak_alloc_kb_p95 {current['peak_alloc_kb_p95']} "
+                            f"> baseline {previous['peak_alloc_kb_p95']}")
+
+        timing = warnings if timing_tolerance is None else failures
+        tolerance = timing_tolerance or 0.0
+        if current["throughput_mb_s"] < previous["throughput_mb_s"] * (1 - tolerance):
+            timing.append(
+                f"{size} chars: throughput {current['throughput_mb_s']} MB/s "
+                f"< baseline {previous['throughput_mb_s']} MB/s"
+            )
+        for key in ("call_p95_ms", "item_p95_ms"):
+            if current[key] > previous[key] * (1 + tolerance):
+                timing.append(f"{size} chars: {key} {current[key]} > baseline {previous[key]}")
+    return failures, warnings
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark ContentParser on a generated corpus")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated target sizes in characters")
+    parser.add_argument("--samples", type=int, default=20, help="Generated outputs per size")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed parses per output")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus generator seed")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON path")
+    parser.add_argument("--alloc-tolerance", type=float, default=0.0,
+                        help="Allowed fractional growth in peak allocations (default: 0)")
+    parser.add_argument("--timing-tolerance", type=float, default=None,
+                        help="Gate throughput and latency on this fractional regression; "
+                             "timings are report-only when omitted")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the current results as the new baseline")
+    parser.add_argument("--strict-properties", action="store_true",
+                        help="Fail on any property violation, including ones in the baseline")
+    args = parser.parse_args(argv)
+    args.sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.parsers.content_parser import ContentParser
+
+    args = parse_args(argv)
+
+    print("\n" + "="*60)
+    print("⏱️  ContentParser Throughput Benchmark")
+    print("="*60 + "\n")
+
+    parser = ContentParser()
+    corpus = generate_corpus(args.seed, args.sizes, args.samples)
+
+    results: Dict[str, Dict] = {}
+    for size, samples in corpus.items():
+        stats = benchmark_size(parser, samples, args.repeats)
+        results[str(size)] = stats
+        print(f"📝 {size:>7} chars (mean {stats['mean_chars']:>7}): "
+              f"{stats['throughput_mb_s']:>8.3f} MB/s | "
+              f"p50 {stats['call_p50_ms']:.2f}ms | p95 {stats['call_p95_ms']:.2f}ms | "
+              f"item p95 {stats['item_p95_ms']:.2f}ms | peak {stats['peak_alloc_kb_p95']:.0f} KB")
+
+    failures: List[str] = []
+    warnings: List[str] = []
+    for size, stats in results.items():
+        if stats["reasoning_items"]:
+            warnings.append(f"{size} chars: {stats['reasoning_items']} parsed items carry reasoning "
+                            f"text (filtered upstream by extract_agent_output)")
+        if args.strict_properties:
+            failures.extend(f"{size} chars: {v}" for v in stats["property_violations"])
+        limit = DOCUMENTED_LATENCY_MS.get(int(size))
+        if limit is not None and stats["call_p95_ms"] > limit:
+            failures.append(f"{size} chars: p95 {stats['call_p95_ms']}ms exceeds documented {limit}ms")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({size: {k: v for k, v in stats.items() if k != "reasoning_items"}
+                       for size, stats in results.items()}, f, indent=2)
+            f.write("\n")
+        # Recording a baseline accepts the current state, so nothing fails
+        warnings.extend(failures)
+        warnings.extend(f"{size} chars: recorded as known: {v}"
+                        for size, stats in results.items() for v in stats["property_violations"])
+        failures = []
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline_failures, baseline_warnings = compare_to_baseline(
+                results, json.load(f), args.alloc_tolerance, args.timing_tolerance
+            )
+        failures.extend(baseline_failures)
+        warnings.extend(baseline_warnings)
+    else:
+        failures.append(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+
+    print()
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    if args.update_baseline:
+        print(f"✅ Baseline written to {args.baseline}")
+        return 0
+    if failures:
+        print("❌ FAILURE: Parser benchmark regressions")
+        for failure in failures:
+            print(f"   - {failure}")
+        return 1
+
+    print("✅ SUCCESS: No parser regressions detected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
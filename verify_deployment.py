@@ -2,18 +2,48 @@
 """
 Deployment Verification Script
 Tests all deployed improvements for content-generation-improvements spec
+
+Usage:
+    python verify_deployment.py             # one-shot pass/fail checks
+    python verify_deployment.py --probe     # continuous latency probes with SLOs
 """
 
+import argparse
 import requests
 import json
+import os
+import socket
+import ssl
+import sys
 import time
-from typing import Dict, List, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    import websocket  # websocket-client, only needed for the WebSocket probe
+except ImportError:
+    websocket = None
 
 # Configuration
 API_BASE_URL = "https://api.blacksteep.com"
 FRONTEND_URL = "https://d2b386ss3jk33z.cloudfront.net"
 TEST_USER_ID = "test_deployment_verification"
 
+# Probe mode configuration
+PROBE_TIMEOUT_SECONDS = 30
+GENERATE_TIMEOUT_SECONDS = 120
+PROBE_TICK_SECONDS = 0.05
+METRICS_NAMESPACE = "content-marketing-swarm/dev"
+DEFAULT_SLO_P95_MS = {
+    "health": 500,
+    "tls_handshake": 300,
+    "cors_preflight": 500,
+    "generate_content": 90000,
+    "websocket_first_message": 2000,
+}
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -268,7 +298,318 @@ def run_all_tests() -> Tuple[int, int]:
     
     return passed, failed
 
-def main():
+# ---------------------------------------------------------------------------
+# Probe mode: concurrent, scheduled latency checks with rolling SLOs
+# ---------------------------------------------------------------------------
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+def probe_health() -> Tuple[bool, float, str]:
+    """Latency of GET /health; only a healthy 200 counts as success"""
+    start = time.perf_counter()
+    response = requests.get(f"{API_BASE_URL}/health", timeout=PROBE_TIMEOUT_SECONDS)
+    latency_ms = _elapsed_ms(start)
+    ok = response.status_code == 200 and response.json().get("status") == "healthy"
+    return ok, latency_ms, f"status {response.status_code}"
+
+def probe_tls_handshake() -> Tuple[bool, float, str]:
+    """Latency of the TLS handshake alone, excluding TCP connect"""
+    parsed = urlparse(API_BASE_URL)
+    host = parsed.hostname
+    port = parsed.port or 443
+    context = ssl.create_default_context()
+    with socket.create_connection((host, port), timeout=PROBE_TIMEOUT_SECONDS) as sock:
+        start = time.perf_counter()
+        with context.wrap_socket(sock, server_hostname=host) as tls_sock:
+            latency_ms = _elapsed_ms(start)
+            return True, latency_ms, tls_sock.version() or "unknown"
+
+def probe_cors_preflight() -> Tuple[bool, float, str]:
+    """Latency of the CORS preflight for /api/generate-content"""
+    headers = {
+        "Origin": FRONTEND_URL,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "Content-Type"
+    }
+    start = time.perf_counter()
+    response = requests.options(
+        f"{API_BASE_URL}/api/generate-content",
+        headers=headers,
+        timeout=PROBE_TIMEOUT_SECONDS
+    )
+    latency_ms = _elapsed_ms(start)
+    ok = response.status_code < 400 and "access-control-allow-origin" in response.headers
+    return ok, latency_ms, f"status {response.status_code}"
+
+def probe_generate_content() -> Tuple[bool, float, str]:
+    """End-to-end latency of /api/generate-content; 500s and timeouts are failures"""
+    payload = {
+        "user_id": TEST_USER_ID,
+        "prompt": "Test deployment verification",
+        "platforms": ["linkedin"]
+    }
+    start = time.perf_counter()
+    response = requests.post(
+        f"{API_BASE_URL}/api/generate-content",
+        json=payload,
+        timeout=GENERATE_TIMEOUT_SECONDS
+    )
+    latency_ms = _elapsed_ms(start)
+    return response.status_code == 200, latency_ms, f"status {response.status_code}"
+
+def probe_websocket_first_message() -> Tuple[Optional[bool], float, str]:
+    """Time from opening /ws/stream-generation to the 'connected' message"""
+    if websocket is None:
+        return None, 0.0, "skipped: websocket-client is not installed"
+    ws_url = API_BASE_URL.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+    start = time.perf_counter()
+    conn = websocket.create_connection(
+        f"{ws_url}/ws/stream-generation",
+        timeout=PROBE_TIMEOUT_SECONDS,
+        origin=FRONTEND_URL
+    )
+    try:
+        message = conn.recv()
+        latency_ms = _elapsed_ms(start)
+    finally:
+        conn.close()
+    message_type = json.loads(message).get("type")
+    return message_type == "connected", latency_ms, f"first message type {message_type}"
+
+PROBES = {
+    "health": probe_health,
+    "tls_handshake": probe_tls_handshake,
+    "cors_preflight": probe_cors_preflight,
+    "generate_content": probe_generate_content,
+    "websocket_first_message": probe_websocket_first_message,
+}
+
+def run_probe(name: str) -> Dict:
+    """Run a single probe, turning exceptions (including timeouts) into failures"""
+    start = time.perf_counter()
+    try:
+        ok, latency_ms, detail = PROBES[name]()
+    except Exception as e:
+        ok, latency_ms, detail = False, _elapsed_ms(start), f"{type(e).__name__}: {e}"
+    return {"check": name, "ok": ok, "latency_ms": latency_ms, "detail": detail}
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile; None for an empty sample"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(-(-pct * len(ordered) // 100)))
+    return ordered[rank - 1]
+
+def summarize_windows(windows: Dict[str, Deque[Dict]]) -> Dict[str, Dict]:
+    """Rolling p50/p95 over successful samples plus error rate per check"""
+    summary = {}
+    for name, samples in windows.items():
+        latencies = [s["latency_ms"] for s in samples if s["ok"]]
+        errors = sum(1 for s in samples if not s["ok"])
+        summary[name] = {
+            "samples": len(samples),
+            "errors": errors,
+            "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+        }
+    return summary
+
+def evaluate_slos(summary: Dict[str, Dict], slo_p95_ms: Dict[str, float],
+                  max_error_rate: float) -> List[str]:
+    """Return human-readable SLO violations for the current window"""
+    violations = []
+    for name, stats in summary.items():
+        if stats["samples"] == 0:
+            continue
+        if stats["error_rate"] > max_error_rate:
+            violations.append(
+                f"{name}: error rate {stats['error_rate']:.2%} > {max_error_rate:.2%}"
+            )
+        threshold = slo_p95_ms.get(name)
+        if threshold is not None and stats["p95_ms"] is not None and stats["p95_ms"] > threshold:
+            violations.append(f"{name}: p95 {stats['p95_ms']:.0f}ms > {threshold:.0f}ms")
+    return violations
+
+def format_emf(summary: Dict[str, Dict], timestamp: float) -> List[Dict]:
+    """CloudWatch Embedded Metric Format records, one per check with samples"""
+    records = []
+    for name, stats in summary.items():
+        values = {
+            "LatencyP50": (stats["p50_ms"], "Milliseconds"),
+            "LatencyP95": (stats["p95_ms"], "Milliseconds"),
+            "ErrorRate": (stats["error_rate"], "None"),
+        }
+        if stats["samples"] == 0:
+            continue
+        values = {k: v for k, v in values.items() if v[0] is not None}
+        record = {
+            "_aws": {
+                "Timestamp": int(timestamp * 1000),
+                "CloudWatchMetrics": [{
+                    "Namespace": METRICS_NAMESPACE,
+                    "Dimensions": [["Check"]],
+                    "Metrics": [{"Name": k, "Unit": unit} for k, (_, unit) in values.items()],
+                }],
+            },
+            "Check": name,
+        }
+        record.update({k: value for k, (value, _) in values.items()})
+        records.append(record)
+    return records
+
+def run_probe_mode(checks: List[str], interval: float, rounds: int, window: int,
+                   slo_p95_ms: Dict[str, float], max_error_rate: float,
+                   output_format: str) -> int:
+    """Run each selected probe on its own `interval` schedule.
+
+    Checks are scheduled independently, so a slow generate-content call
+    does not hold back the health, TLS or CORS samples. A check still
+    running when its next run is due skips that run and reports the
+    overrun on stderr. Every completed sample is emitted on stdout with
+    the rolling summary; the exit code reflects the SLO evaluation after
+    the last sample.
+    """
+    windows = {name: deque(maxlen=window) for name in checks}
+    completed = {name: 0 for name in checks}
+    next_due = {name: time.monotonic() for name in checks}
+    in_flight: Dict[str, Future] = {}
+    skipped_reported = set()
+    violations: List[str] = []
+
+    def wants_more(name: str) -> bool:
+        return rounds == 0 or completed[name] + (name in in_flight) < rounds
+
+    executor = ThreadPoolExecutor(max_workers=len(checks))
+    try:
+        while rounds == 0 or any(completed[name] < rounds for name in checks):
+            for name in checks:
+                future = in_flight.get(name)
+                if future is not None and future.done():
+                    del in_flight[name]
+                    completed[name] += 1
+                    result = future.result()
+                    timestamp = time.time()
+
+                    if result["ok"] is None:
+                        if name not in skipped_reported:
+                            skipped_reported.add(name)
+                            print(f"Probe {name} {result['detail']}", file=sys.stderr)
+                    else:
+                        windows[name].append(result)
+
+                    summary = summarize_windows(windows)
+                    violations = evaluate_slos(summary, slo_p95_ms, max_error_rate)
+
+                    if output_format == "metrics":
+                        for record in format_emf({name: summary[name]}, timestamp):
+                            print(json.dumps(record), flush=True)
+                    else:
+                        print(json.dumps({
+                            "timestamp": timestamp,
+                            "result": result,
+                            "summary": summary,
+                            "violations": violations,
+                        }), flush=True)
+
+                    for violation in violations:
+                        if violation.startswith(f"{name}:"):
+                            print(f"SLO violation: {violation}", file=sys.stderr)
+
+                now = time.monotonic()
+                if now >= next_due[name] and wants_more(name):
+                    if name in in_flight:
+                        if interval > 0:
+                            print(f"Probe {name} overran the {interval:g}s interval; skipping this run",
+                                  file=sys.stderr)
+                    else:
+                        in_flight[name] = executor.submit(run_probe, name)
+                    next_due[name] = max(next_due[name] + interval, now) if interval > 0 else now
+
+            time.sleep(PROBE_TICK_SECONDS)
+    except KeyboardInterrupt:
+        # Don't wait up to GENERATE_TIMEOUT_SECONDS for in-flight probes
+        executor.shutdown(wait=False, cancel_futures=True)
+        exit_code = 0 if not violations else 1
+        if in_flight:
+            # Interpreter shutdown would still join the executor's worker
+            # threads, so leave without running exit handlers
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+        return exit_code
+
+    executor.shutdown()
+    return 0 if not violations else 1
+
+def parse_slo_overrides(values: List[str]) -> Dict[str, float]:
+    """Parse repeated `--slo check=ms` arguments over the defaults"""
+    slo = dict(DEFAULT_SLO_P95_MS)
+    for value in values:
+        name, sep, threshold = value.partition("=")
+        if not sep or name not in PROBES:
+            raise argparse.ArgumentTypeError(f"Invalid --slo value: {value}")
+        try:
+            slo[name] = float(threshold)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid --slo threshold for {name}: {threshold!r}")
+        if not slo[name] > 0:
+            raise argparse.ArgumentTypeError(f"--slo threshold for {name} must be positive: {threshold}")
+    return slo
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Verify and probe the deployed API")
+    parser.add_argument("--probe", action="store_true",
+                        help="Run continuous latency probes instead of the one-shot checks")
+    parser.add_argument("--checks", default=",".join(PROBES),
+                        help=f"Comma-separated probes to run (default: {','.join(PROBES)})")
+    parser.add_argument("--interval", type=float, default=60.0,
+                        help="Seconds between runs of each check (default: 60)")
+    parser.add_argument("--rounds", type=int, default=0,
+                        help="Runs per check, 0 to run until interrupted (default: 0)")
+    parser.add_argument("--window", type=int, default=20,
+                        help="Samples per check in the rolling window (default: 20)")
+    parser.add_argument("--slo", action="append", default=[], metavar="CHECK=MS",
+                        help="Override a p95 latency threshold in milliseconds")
+    parser.add_argument("--max-error-rate", type=float, default=0.0,
+                        help="Maximum tolerated error rate per check, in [0, 1) (default: 0)")
+    parser.add_argument("--format", choices=["json", "metrics"], default="json",
+                        help="json: one summary line per sample; metrics: CloudWatch EMF records")
+    args = parser.parse_args(argv)
+
+    args.checks = [c.strip() for c in args.checks.split(",") if c.strip()]
+    unknown = [c for c in args.checks if c not in PROBES]
+    if unknown or not args.checks:
+        parser.error(f"Unknown checks: {', '.join(unknown)}" if unknown else "No checks selected")
+    if args.window < 1:
+        parser.error("--window must be at least 1")
+    if args.rounds < 0:
+        parser.error("--rounds must not be negative")
+    if args.interval < 0:
+        parser.error("--interval must not be negative")
+    if not 0 <= args.max_error_rate < 1:
+        parser.error("--max-error-rate must be at least 0 and below 1")
+    try:
+        args.slo = parse_slo_overrides(args.slo)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    return args
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    if args.probe:
+        return run_probe_mode(
+            checks=args.checks,
+            interval=args.interval,
+            rounds=args.rounds,
+            window=args.window,
+            slo_p95_ms=args.slo,
+            max_error_rate=args.max_error_rate,
+            output_format=args.format
+        )
+
     print_header("Content Generation Improvements - Deployment Verification")
     print(f"API Base URL: {API_BASE_URL}")
     print(f"Frontend URL: {FRONTEND_URL}")